@@ -0,0 +1,248 @@
+"""
+Numeric kernels for the per-block audio ingest and metering paths
+"""
+
+import math
+import numpy as np
+from typing import Tuple
+
+try:
+    # Optional JIT compiler (pip install numba)
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    # Optional SIMD kernel (pip install numpy-rms)
+    from numpy_rms import rms as _rms_simd
+except ImportError:
+    _rms_simd = None
+
+
+def _rms_peak_numpy(x: np.ndarray) -> Tuple[float, float]:
+    """
+    Compute RMS and absolute peak of a non-empty 1-D block with NumPy
+
+    Args:
+        x: Contiguous 1-D audio block
+
+    Returns:
+        Tuple of (RMS level, Peak level)
+    """
+    if _rms_simd is not None and x.dtype == np.float32 and x.flags['C_CONTIGUOUS']:
+        # Streaming square-mean-sqrt in C/SIMD
+        rms = float(_rms_simd(x, window_size=x.size)[0])
+    else:
+        # RMS via a single dot product (one pass, no temporary array)
+        rms = math.sqrt(float(np.dot(x, x)) / x.size)
+
+    # Peak without allocating an abs() copy of the block
+    peak = float(max(x.max(), -x.min()))
+    return rms, peak
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def rms_peak(x):
+        """Compute RMS and absolute peak of a non-empty float32 block in one pass"""
+        # Accumulate in float32 and take the peak over the sign-cleared IEEE
+        # bit patterns (ordered like the magnitudes), so both reductions
+        # vectorize at full float32 SIMD width
+        bits = x.view(np.uint32)
+        s = np.float32(0.0)
+        m = np.uint32(0)
+        for i in range(x.shape[0]):
+            v = x[i]
+            s += v * v
+            b = bits[i] & np.uint32(0x7FFFFFFF)
+            m = b if b > m else m
+        peak = np.array([m], dtype=np.uint32).view(np.float32)[0]
+        return math.sqrt(s / x.shape[0]), peak
+else:
+    rms_peak = _rms_peak_numpy
+
+
+def _meter_block_py(x: np.ndarray, frames: int, state: np.ndarray, hold_samples: int) -> float:
+    """
+    Measure a non-empty block and advance the peak-hold state
+
+    Plain Python so Numba can compile the same body into meter_block.
+
+    Args:
+        x: Contiguous 1-D float32 audio block
+        frames: Number of frames in the block (counted against the hold time)
+        state: Float array of (held peak, hold counter), updated in place
+        hold_samples: Hold time in samples for a new peak
+
+    Returns:
+        RMS level of the block
+    """
+    rms, peak = rms_peak(x)
+    if peak > state[0]:
+        state[0] = peak
+        state[1] = hold_samples
+    elif state[1] > 0:
+        state[1] -= frames
+    else:
+        state[0] = peak
+    return rms
+
+
+if njit is not None:
+    # Same body compiled, so RMS, peak and peak-hold run in one native call
+    meter_block = njit(cache=True, fastmath=True)(_meter_block_py)
+else:
+    meter_block = _meter_block_py
+
+
+def _ring_write_numpy(flat: np.ndarray, buf: np.ndarray, write_idx: int) -> int:
+    """
+    Write samples into a circular buffer, wrapping at the end
+
+    Args:
+        flat: 1-D samples to write
+        buf: Circular buffer, same dtype as flat
+        write_idx: Index of the oldest sample in buf
+
+    Returns:
+        New write index
+    """
+    size = buf.shape[0]
+    n = flat.shape[0]
+    if n > size:
+        # Only the last size samples survive; start them where a sample-by-sample
+        # write would have put them, so the layout matches the compiled kernel
+        write_idx = (write_idx + n - size) % size
+        flat = flat[-size:]
+        n = size
+    end = write_idx + n
+    # copyto with casting='no' is a straight copy for matching dtypes
+    if end <= size:
+        np.copyto(buf[write_idx:end], flat, casting='no')
+    else:
+        split = size - write_idx
+        np.copyto(buf[write_idx:], flat[:split], casting='no')
+        np.copyto(buf[:n - split], flat[split:], casting='no')
+    return end % size
+
+
+def _apply_gain_numpy(indata: np.ndarray, gain: float, dst: np.ndarray, with_level: bool) -> float:
+    """
+    Scale a block by gain into dst
+
+    Args:
+        indata: Input block (frames, channels)
+        gain: Gain multiplier
+        dst: Destination block, same shape as indata
+        with_level: Whether to measure the mean absolute level
+
+    Returns:
+        Mean absolute level of dst, or 0.0 if not measured
+    """
+    np.multiply(indata, gain, out=dst)
+    if with_level:
+        return float(np.abs(dst).mean())
+    return 0.0
+
+
+def _ingest_numpy(indata: np.ndarray, gain: float, dst: np.ndarray, buf: np.ndarray,
+                  write_idx: int, with_level: bool) -> Tuple[int, float]:
+    """
+    Scale a block by gain into dst and append it to a circular buffer
+
+    Args:
+        indata: Input block (frames, channels)
+        gain: Gain multiplier
+        dst: Destination block, same shape as indata
+        buf: Circular buffer
+        write_idx: Index of the oldest sample in buf
+        with_level: Whether to measure the mean absolute level
+
+    Returns:
+        Tuple of (new write index, mean absolute level or 0.0)
+    """
+    level = _apply_gain_numpy(indata, gain, dst, with_level)
+    return _ring_write_numpy(dst.reshape(-1), buf, write_idx), level
+
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def ring_write(flat, buf, write_idx):
+        """Write samples into a circular buffer, returning the new write index"""
+        size = buf.shape[0]
+        j = write_idx
+        for i in range(flat.shape[0]):
+            buf[j] = flat[i]
+            j += 1
+            if j == size:
+                j = 0
+        return j
+
+    @njit(cache=True, fastmath=True)
+    def apply_gain(indata, gain, dst, with_level):
+        """Scale a block by gain into dst, returning its mean absolute level"""
+        s = 0.0
+        for i in range(indata.shape[0]):
+            for c in range(indata.shape[1]):
+                y = indata[i, c] * gain
+                dst[i, c] = y
+                s += abs(y)
+        if with_level and indata.size > 0:
+            return s / indata.size
+        return 0.0
+
+    @njit(cache=True, fastmath=True)
+    def ingest(indata, gain, dst, buf, write_idx, with_level):
+        """Gain, level and circular buffer write of one block in a single pass"""
+        size = buf.shape[0]
+        j = write_idx
+        s = 0.0
+        for i in range(indata.shape[0]):
+            for c in range(indata.shape[1]):
+                y = indata[i, c] * gain
+                dst[i, c] = y
+                buf[j] = y
+                s += abs(y)
+                j += 1
+                if j == size:
+                    j = 0
+        if with_level and indata.size > 0:
+            return j, s / indata.size
+        return j, 0.0
+else:
+    ring_write = _ring_write_numpy
+    apply_gain = _apply_gain_numpy
+    ingest = _ingest_numpy
+
+
+_ingest_compiled = False
+_meter_compiled = False
+
+
+def warm_up_ingest() -> None:
+    """
+    Compile the AudioSource ingest kernels for the argument types used at runtime
+
+    Numba compiles on first call; doing it here keeps that cost (hundreds of
+    milliseconds or more) off the real-time audio thread. Safe to call often.
+    """
+    global _ingest_compiled
+    if njit is None or _ingest_compiled:
+        return
+    block = np.zeros((2, 1), dtype=np.float32)
+    dst = np.zeros_like(block)
+    buf = np.zeros(4, dtype=np.float32)
+    ingest(block, 1.0, dst, buf, 0, True)
+    apply_gain(block, 1.0, dst, True)
+    ring_write(buf, buf, 0)
+    _ingest_compiled = True
+
+
+def warm_up_meter() -> None:
+    """Compile the AudioMeter kernels for the argument types used at runtime"""
+    global _meter_compiled
+    if njit is None or _meter_compiled:
+        return
+    x = np.zeros(2, dtype=np.float32)
+    meter_block(x, 2, np.zeros(2, dtype=np.float64), 1)
+    _meter_compiled = True
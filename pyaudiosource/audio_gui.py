@@ -3,16 +3,42 @@ GUI components for pyaudiosource package
 """
 
 import logging
+import time
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, 
     QComboBox, QProgressBar, QLabel, QSlider
 )
-from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtCore import Qt, QObject, pyqtSignal
 from .audio_source import AudioSource
 from .audio_meter import AudioMeter
 from .device_manager import DeviceManager
 
+class _LevelSignals(QObject):
+    """Carries meter levels (RMS dB, peak dB) from the audio thread to the GUI"""
+    levels = pyqtSignal(float, float)
+
 class AudioTestWindow(QMainWindow):
+    # Minimum interval between meter updates sent to the GUI, in seconds
+    METER_INTERVAL = 0.05
+    
+    # Meter stylesheet, and the finished sheet per level band so restyling
+    # is a lookup
+    _STYLE_TEMPLATE = """
+            QProgressBar {{
+                border: 2px solid grey;
+                border-radius: 5px;
+                text-align: center;
+            }}
+            QProgressBar::chunk {{
+                background-color: {color};
+            }}
+        """
+    _STYLES = {
+        "red": _STYLE_TEMPLATE.format(color="red"),
+        "yellow": _STYLE_TEMPLATE.format(color="yellow"),
+        "green": _STYLE_TEMPLATE.format(color="#2ecc71"),
+    }
+    
     def __init__(self):
         super().__init__()
         self.setWindowTitle("PyAudioSource Test")
@@ -51,6 +77,18 @@ class AudioTestWindow(QMainWindow):
         layout.addWidget(QLabel("Peak Level (dB):"))
         layout.addWidget(self.peak_meter)
         
+        # Last displayed value and band per meter; widgets update only on change
+        self._last_rms_value = None
+        self._last_peak_value = None
+        self._rms_color = None
+        self._peak_color = None
+        
+        # Levels are pushed from the audio thread and delivered on the GUI thread
+        self._level_signals = _LevelSignals()
+        self._level_signals.levels.connect(
+            self.update_meters, Qt.ConnectionType.QueuedConnection)
+        self._last_emit = 0.0
+        
         # Initialize audio components
         self.device_manager = DeviceManager()
         self.audio_source = AudioSource()
@@ -65,11 +103,6 @@ class AudioTestWindow(QMainWindow):
         # Start audio
         self.start_audio()
         
-        # Update timer for UI
-        self.update_timer = QTimer()
-        self.update_timer.timeout.connect(self.update_meters)
-        self.update_timer.start(50)  # 50ms refresh rate
-        
     def update_device_list(self):
         """Update the device selector with available input devices"""
         self.device_selector.clear()
@@ -88,41 +121,38 @@ class AudioTestWindow(QMainWindow):
         self.audio_source.stop()
         
     def process_audio(self, indata, level, *args):
-        """Process audio data"""
+        """Process audio data (runs on the audio thread)"""
         self.audio_meter.process(indata)
         
-    def update_meters(self):
+        # Throttle GUI updates to the meter refresh rate
+        now = time.monotonic()
+        if now - self._last_emit >= self.METER_INTERVAL:
+            self._last_emit = now
+            self._level_signals.levels.emit(*self.audio_meter.get_levels_db())
+        
+    def update_meters(self, rms_db, peak_db):
         """Update the level meters"""
-        rms_db = self.audio_meter.get_rms_db()
-        peak_db = self.audio_meter.get_peak_db()
-        
-        # Update progress bars
-        self.rms_meter.setValue(int(rms_db))
-        self.peak_meter.setValue(int(peak_db))
-        
-        # Update color based on level
-        self.update_meter_color(self.rms_meter, rms_db)
-        self.update_meter_color(self.peak_meter, peak_db)
-        
-    def update_meter_color(self, meter, level):
-        """Update meter color based on level"""
-        if level > -3:
-            color = "red"
-        elif level > -12:
-            color = "yellow"
-        else:
-            color = "#2ecc71"  # Green
-            
-        meter.setStyleSheet(f"""
-            QProgressBar {{
-                border: 2px solid grey;
-                border-radius: 5px;
-                text-align: center;
-            }}
-            QProgressBar::chunk {{
-                background-color: {color};
-            }}
-        """)
+        rms_value = max(int(rms_db), self.rms_meter.minimum())
+        peak_value = max(int(peak_db), self.peak_meter.minimum())
+        
+        # Update progress bars and colors only when the displayed dB changes
+        if rms_value != self._last_rms_value:
+            self._last_rms_value = rms_value
+            self.rms_meter.setValue(rms_value)
+            self._rms_color = self.update_meter_color(
+                self.rms_meter, rms_value, self._rms_color)
+        if peak_value != self._last_peak_value:
+            self._last_peak_value = peak_value
+            self.peak_meter.setValue(peak_value)
+            self._peak_color = self.update_meter_color(
+                self.peak_meter, peak_value, self._peak_color)
+        
+    def update_meter_color(self, meter, level, current_band=None):
+        """Update meter color based on level, returning the band in use"""
+        band = "red" if level > -3 else "yellow" if level > -12 else "green"
+        if band != current_band:
+            meter.setStyleSheet(self._STYLES[band])
+        return band
         
     def on_device_changed(self, index):
         """Handle device selection change"""
@@ -2,8 +2,10 @@
 Audio level metering functionality
 """
 
+import math
 import numpy as np
 from typing import Tuple, Optional
+from ._kernels import meter_block, warm_up_meter
 
 class AudioMeter:
     """
@@ -26,9 +28,50 @@ class AudioMeter:
         self.sample_rate = sample_rate
         
         self.peak_hold_samples = int(peak_hold_time * sample_rate)
-        self.current_peak = 0.0
-        self.peak_hold_counter = 0
+        # Peak-hold state (held peak, hold counter) updated by the meter kernel
+        self._peak_state = np.zeros(2, dtype=np.float64)
+        
+        # dB levels are cached whenever a level changes (the setters keep them
+        # in sync), so readers never redo the log10
         self.last_rms = 0.0
+        self.current_peak = 0.0
+        
+        # Compile the meter kernel now, not on the first (audio thread) block
+        warm_up_meter()
+    
+    @property
+    def last_rms(self) -> float:
+        """RMS level of the last processed block"""
+        return self._last_rms
+    
+    @last_rms.setter
+    def last_rms(self, value: float) -> None:
+        self._last_rms = float(value)
+        self._last_rms_db = self._to_db(self._last_rms)
+    
+    @property
+    def current_peak(self) -> float:
+        """Current (held) peak level"""
+        return float(self._peak_state[0])
+    
+    @current_peak.setter
+    def current_peak(self, value: float) -> None:
+        self._peak_state[0] = value
+        self._last_peak_db = self._to_db(float(value))
+    
+    @property
+    def peak_hold_counter(self) -> int:
+        """Samples left before the held peak is released"""
+        return int(self._peak_state[1])
+    
+    @peak_hold_counter.setter
+    def peak_hold_counter(self, value: int) -> None:
+        self._peak_state[1] = value
+    
+    @staticmethod
+    def _to_db(level: float) -> float:
+        """Convert a linear level to dB, floored at 1e-10 (-200 dB)"""
+        return 20.0 * math.log10(max(level, 1e-10))
     
     def process(self, audio_data: np.ndarray) -> Tuple[float, float]:
         """
@@ -40,20 +83,15 @@ class AudioMeter:
         Returns:
             Tuple of (RMS level, Peak level)
         """
-        # Calculate RMS
-        if len(audio_data) > 0:
-            self.last_rms = np.sqrt(np.mean(np.square(audio_data)))
-        
-        # Calculate peak
-        if len(audio_data) > 0:
-            current_peak = np.max(np.abs(audio_data))
-            if current_peak > self.current_peak:
-                self.current_peak = current_peak
-                self.peak_hold_counter = self.peak_hold_samples
-            elif self.peak_hold_counter > 0:
-                self.peak_hold_counter -= len(audio_data)
-            else:
-                self.current_peak = current_peak
+        if audio_data.size > 0:
+            # The meter works in float32 regardless of input precision; this is
+            # a no-op for the float32 blocks AudioSource delivers
+            flat = np.ascontiguousarray(audio_data, dtype=np.float32).reshape(-1)
+            self.last_rms = meter_block(
+                flat, len(audio_data), self._peak_state, self.peak_hold_samples)
+            
+            # The kernel updates the held peak in place, bypassing the setter
+            self._last_peak_db = self._to_db(self.current_peak)
         
         return self.last_rms, self.current_peak
     
@@ -64,18 +102,16 @@ class AudioMeter:
         Returns:
             Tuple of (RMS level in dB, Peak level in dB)
         """
-        rms_db = 20 * np.log10(max(self.last_rms, 1e-10))
-        peak_db = 20 * np.log10(max(self.current_peak, 1e-10))
-        return rms_db, peak_db
+        return self._last_rms_db, self._last_peak_db
 
     def get_rms_db(self) -> float:
         """Get RMS level in dB"""
         if self.last_rms > 0:
-            return 20 * np.log10(self.last_rms)
+            return self._last_rms_db
         return -60.0
     
     def get_peak_db(self) -> float:
         """Get peak level in dB"""
         if self.current_peak > 0:
-            return 20 * np.log10(self.current_peak)
+            return self._last_peak_db
         return -60.0
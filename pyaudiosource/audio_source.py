@@ -2,12 +2,12 @@
 Core audio input handling functionality
 """
 
-import queue
 import threading
 import logging
 import numpy as np
 import sounddevice as sd
 from typing import Callable, Optional, Union, Dict, Any
+from ._kernels import apply_gain, ingest, ring_write, warm_up_ingest
 
 AudioCallback = Callable[[np.ndarray, float], None]
 
@@ -18,10 +18,19 @@ class AudioSource:
     Args:
         sample_rate (int): Sample rate in Hz (default: 44100)
         channels (int): Number of input channels (default: 1)
-        frame_size (int): Size of each audio frame in samples (default: 1024)
+        frame_size (int): Size of each audio frame in samples (default: 1024). This
+            is the fixed block size of the stream and must be positive; blocks are
+            stored in preallocated slots of this size, so sounddevice's variable
+            block size (0) is not supported.
         buffer_size (int): Size of the internal buffer in samples (default: 44100)
         device_index (Optional[int]): Index of input device to use (default: None, uses system default)
         gain (float): Input gain multiplier (default: 1.0)
+        deferred (bool): Run the client callback on a separate processing thread
+            instead of the audio thread (default: False). Use this for callbacks
+            that may block or take longer than one frame.
+    
+    By default the client callback runs directly on the real-time audio thread,
+    so it must be fast and must not block (no I/O, locks or sleeping).
     """
     
     def __init__(
@@ -31,35 +40,69 @@ class AudioSource:
         frame_size: int = 1024,
         buffer_size: int = 44100,
         device_index: Optional[int] = None,
-        gain: float = 1.0
+        gain: float = 1.0,
+        deferred: bool = False
     ):
+        if frame_size <= 0:
+            raise ValueError(f"frame_size must be a positive block size, got {frame_size}")
+        
         self.sample_rate = sample_rate
         self.channels = channels
         self.frame_size = frame_size
         self.buffer_size = buffer_size
         self.gain = gain
+        self.deferred = deferred
         
-        # Initialize audio buffer and state
+        # Initialize audio buffer (circular, oldest sample at _write_idx) and state
         self.audio_buffer = np.zeros(buffer_size, dtype=np.float32)
+        self._write_idx = 0
         self.should_stop = False
         self.stream = None
         self.current_device = device_index
         
-        # Queue for audio data
-        self.audio_queue = queue.Queue()
+        # Debug level logging is costly on the audio thread; decide once
+        self._log_debug = logging.getLogger().isEnabledFor(logging.DEBUG)
+        
+        # Single-producer single-consumer ring of preallocated blocks. Only the
+        # audio callback advances _ring_write and only the processor thread
+        # advances _ring_read, so neither side needs a lock. In inline mode
+        # the ring just cycles the destination of the gain stage.
+        self._ring_slots = 8
+        self._ring = np.zeros((self._ring_slots, frame_size, channels), dtype=np.float32)
+        self._ring_levels = [0.0] * self._ring_slots
+        self._ring_write = 0
+        self._ring_read = 0
+        self._data_ready = threading.Event()
+        self._xruns = 0
+        
+        # The ingest kernels rely on contiguous float32 storage for plain copies
+        assert self.audio_buffer.flags['C_CONTIGUOUS'] and self.audio_buffer.dtype == np.float32
+        assert self._ring.flags['C_CONTIGUOUS'] and self._ring.dtype == np.float32
         
         # Callback for client code
         self.callback: Optional[AudioCallback] = None
         
-        # Start processing thread
-        self.processing_thread = threading.Thread(target=self._audio_processor)
-        self.processing_thread.daemon = True
-        self.processing_thread.start()
+        # Start processing thread only when callbacks are deferred
+        self.processing_thread: Optional[threading.Thread] = None
+        if deferred:
+            self.processing_thread = threading.Thread(target=self._audio_processor)
+            self.processing_thread.daemon = True
+            self.processing_thread.start()
         
         # Start audio stream if device specified
         if device_index is not None:
             self.start(device_index)
     
+    @property
+    def gain(self) -> float:
+        """Input gain multiplier"""
+        return self._gain
+    
+    @gain.setter
+    def gain(self, value: float) -> None:
+        # Always a float, so the compiled kernels never see a new argument type
+        self._gain = float(value)
+    
     def start(self, device_index: int) -> None:
         """Start audio input from specified device"""
         try:
@@ -77,6 +120,9 @@ class AudioSource:
             self.current_device = device_index
             logging.info(f"Opening stream with sample rate {self.sample_rate}Hz, channels: {self.channels}")
             
+            # Compile the ingest kernels before the audio thread needs them
+            warm_up_ingest()
+            
             # Create and start stream
             self.stream = sd.InputStream(
                 device=device_index,
@@ -106,12 +152,22 @@ class AudioSource:
         self.gain = max(0.0, gain)
     
     def set_callback(self, callback: AudioCallback) -> None:
-        """Set callback for audio data"""
+        """
+        Set callback for audio data
+        
+        The array passed to the callback is a reused ring slot; copy it if it
+        needs to outlive the call.
+        """
         self.callback = callback
     
     def get_buffer(self) -> np.ndarray:
-        """Get current audio buffer"""
-        return self.audio_buffer.copy()
+        """Get current audio buffer, oldest sample first"""
+        idx = self._write_idx
+        return np.concatenate((self.audio_buffer[idx:], self.audio_buffer[:idx]))
+    
+    def get_xruns(self) -> int:
+        """Get number of blocks dropped (processor overrun or unexpected block shape)"""
+        return self._xruns
     
     def _audio_callback(self, indata: np.ndarray, frames: int, time: Any, status: Any) -> None:
         """Internal callback for audio data"""
@@ -119,44 +175,121 @@ class AudioSource:
             if status:
                 logging.warning(f"Audio callback status: {status}")
             
-            # Get the raw audio level
-            raw_level = np.abs(indata).mean()
-            if raw_level > 0.0001:  # Only log when there's significant audio
-                logging.debug(f"Raw audio level: {raw_level:.6f}")
+            # Bind hot attributes to locals once per block; the remaining
+            # self.* accesses below are single reads or state write-backs
+            deferred = self.deferred
+            callback = self.callback
+            log_debug = self._log_debug
+            gain = self._gain
+            buf = self.audio_buffer
+            ring = self._ring
+            levels = self._ring_levels
+            slots = self._ring_slots
+            write = self._ring_write
+            
+            # The kernels do no bounds checking, so a block that does not match
+            # the slot shape would write past it; drop it instead
+            if indata.shape != ring.shape[1:]:
+                self._drop_block(f"unexpected block shape {indata.shape}")
+                return
             
-            # Apply gain
-            indata = indata * self.gain
+            # Drop the block if the processor has fallen a full ring behind
+            if deferred and write - self._ring_read >= slots:
+                self._drop_block("processor overrun")
+                return
             
-            # Put the data in the queue
-            self.audio_queue.put_nowait((indata.copy(), raw_level * self.gain))
+            with_level = log_debug or callback is not None
+            if deferred:
+                # Apply gain straight into the next free slot (no allocation)
+                slot = write % slots
+                dst = ring[slot]
+                level = apply_gain(indata, gain, dst, with_level)
+            else:
+                # Gain into the next slot and circular buffer write in the same pass
+                dst = ring[write % slots]
+                self._ring_write = write + 1
+                self._write_idx, level = ingest(
+                    indata, gain, dst, buf, self._write_idx, with_level)
+            
+            if log_debug and level > 0.0001:  # Only log when there's significant audio
+                logging.debug(f"Audio level: {level:.6f}")
+            
+            if deferred:
+                # Publish the slot and wake the processor
+                levels[slot] = level
+                self._ring_write = write + 1
+                self._data_ready.set()
+            elif callback:
+                callback(dst, level)
             
         except Exception as e:
             logging.error(f"Error in audio callback: {e}", exc_info=True)
     
+    def _drop_block(self, reason: str) -> None:
+        """Count a dropped block, logging at a rate the audio thread can afford"""
+        self._xruns += 1
+        if self._xruns % 100 == 1:
+            logging.warning(f"Audio block dropped ({reason}), {self._xruns} block(s) dropped")
+    
     def _audio_processor(self) -> None:
-        """Process audio data from queue"""
+        """Process audio data from the block ring (deferred mode only)"""
         logging.info("Starting audio processor thread")
+        wait = self._data_ready.wait
+        clear = self._data_ready.clear
+        process_batch = self._process_batch
         while not self.should_stop:
             try:
-                # Get data from queue with timeout
-                indata, level = self.audio_queue.get(timeout=0.1)
+                # Wait for the callback to publish a block
+                start = self._ring_read
+                end = self._ring_write
+                if start == end:
+                    wait(timeout=0.1)
+                    clear()
+                    continue
                 
-                # Roll the buffer and add new data
-                samples_to_add = len(indata)
-                self.audio_buffer = np.roll(self.audio_buffer, -samples_to_add)
-                self.audio_buffer[-samples_to_add:] = indata.flatten()
-                
-                # Call client callback if set
-                if self.callback:
-                    self.callback(indata, level)
+                # Drain every block published so far in one wake-up
+                try:
+                    process_batch(start, end)
+                finally:
+                    # Hand the slots back to the callback
+                    self._ring_read = end
                     
-            except queue.Empty:
-                continue
             except Exception as e:
                 logging.error(f"Error processing audio: {e}", exc_info=True)
                 continue
     
+    def _process_batch(self, start: int, end: int) -> None:
+        """Store ring blocks [start, end) and hand each to the client callback"""
+        ring = self._ring
+        slots = self._ring_slots
+        first = start % slots
+        count = end - start
+        
+        # Consecutive slots are contiguous in the ring until it wraps, so the
+        # whole batch goes into the circular buffer in at most two writes
+        stop = min(first + count, slots)
+        self._write_buffer(ring[first:stop].reshape(-1))
+        if first + count > slots:
+            self._write_buffer(ring[:first + count - slots].reshape(-1))
+        
+        # Call client callback once per original block; a failing block must
+        # not skip the rest of the batch
+        callback = self.callback
+        if callback:
+            levels = self._ring_levels
+            for i in range(start, end):
+                slot = i % slots
+                try:
+                    callback(ring[slot], levels[slot])
+                except Exception as e:
+                    logging.error(f"Error processing audio: {e}", exc_info=True)
+    
+    def _write_buffer(self, flat: np.ndarray) -> None:
+        """Write samples into the circular buffer, wrapping at the end"""
+        self._write_idx = ring_write(flat, self.audio_buffer, self._write_idx)
+    
     def __del__(self):
         """Cleanup resources"""
         self.should_stop = True
-        self.stop()
+        if hasattr(self, 'stream'):  # __init__ may have raised early
+            self.stop()
@@ -12,20 +12,28 @@ class DeviceManager:
     """
     
     @staticmethod
-    def list_devices() -> List[Tuple[int, str]]:
+    def list_devices(verbose: bool = False) -> List[Tuple[int, str]]:
         """
         List all available input devices
         
+        Args:
+            verbose: Log each device found at info level (default: False)
+        
         Returns:
             List of tuples containing (device index, device name)
         """
         devices = []
         try:
-            for i, dev in enumerate(sd.query_devices()):
-                if dev['max_input_channels'] > 0:
-                    device_name = f"{dev['name']}"
-                    devices.append((i, device_name))
-                    logging.info(f"Found input device {i}: {device_name}")
+            devices = [
+                (i, dev['name'])
+                for i, dev in enumerate(sd.query_devices())
+                if dev['max_input_channels'] > 0
+            ]
+            if verbose:
+                for i, name in devices:
+                    logging.info(f"Found input device {i}: {name}")
+            else:
+                logging.debug("Input devices: %s", devices)
         except Exception as e:
             logging.error(f"Error listing audio devices: {e}", exc_info=True)
         return devices
@@ -8,6 +8,10 @@ setup(
         "numpy>=1.20.0",
         "sounddevice>=0.4.5",
     ],
+    extras_require={
+        "simd": ["numpy-rms"],
+        "jit": ["numba"],
+    },
     author="Alan",
     author_email="alan@example.com",
     description="A Python package for audio input handling and metering",
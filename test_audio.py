@@ -42,7 +42,7 @@ if __name__ == '__main__':
             sys.exit(1)
         
         # Create audio components
-        audio_source = AudioSource(sample_rate=44100, channels=1)
+        audio_source = AudioSource(sample_rate=44100, channels=1, deferred=True)
         meter = AudioMeter(peak_hold_time=1.0)
         
         # Set up callback
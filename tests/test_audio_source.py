@@ -0,0 +1,45 @@
+"""
+Tests for AudioSource block handling (no audio device required)
+"""
+
+import numpy as np
+import pytest
+from pyaudiosource.audio_source import AudioSource
+
+
+@pytest.mark.parametrize("deferred", [False, True])
+def test_block_with_unexpected_shape_is_dropped(deferred):
+    source = AudioSource(frame_size=4, buffer_size=16, deferred=deferred)
+    calls = []
+    source.set_callback(lambda data, level: calls.append(data.copy()))
+    
+    source._audio_callback(np.ones((6, 1), dtype=np.float32), 6, None, None)
+    
+    assert source.get_xruns() == 1
+    assert calls == []
+    assert not source.get_buffer().any()
+    assert not source._ring.any()
+    assert source._ring_write == 0
+
+
+def test_block_with_expected_shape_is_processed():
+    source = AudioSource(frame_size=4, buffer_size=16, gain=2.0)
+    calls = []
+    source.set_callback(lambda data, level: calls.append((data.copy(), level)))
+    
+    source._audio_callback(np.full((4, 1), 0.25, dtype=np.float32), 4, None, None)
+    
+    assert source.get_xruns() == 0
+    assert len(calls) == 1
+    np.testing.assert_allclose(calls[0][0], 0.5)
+    assert calls[0][1] == pytest.approx(0.5)
+    np.testing.assert_allclose(source.get_buffer()[-4:], 0.5)
+
+
+def test_gain_is_always_float():
+    source = AudioSource(frame_size=4, gain=1)
+    assert type(source.gain) is float
+    source.gain = 2
+    assert type(source.gain) is float
+    source.set_gain(3)
+    assert type(source.gain) is float
@@ -0,0 +1,117 @@
+"""
+Tests that the compiled (Numba) and NumPy kernel backends agree
+"""
+
+import numpy as np
+import pytest
+from pyaudiosource import _kernels
+
+pytest.importorskip("numba")
+
+
+def _block(frames, channels=1, seed=0):
+    rng = np.random.default_rng(seed)
+    return (rng.random((frames, channels), dtype=np.float32) - 0.5)
+
+
+@pytest.mark.parametrize("write_idx, n", [
+    (0, 3),    # no wrap
+    (8, 2),    # ends exactly at the buffer end
+    (8, 5),    # wraps around
+    (3, 10),   # exactly one buffer
+    (3, 25),   # block larger than the buffer
+    (0, 20),   # multiple of the buffer
+])
+def test_ring_write_backends_agree(write_idx, n):
+    flat = np.arange(100, 100 + n, dtype=np.float32)
+    buf_jit = np.arange(10, dtype=np.float32)
+    buf_np = buf_jit.copy()
+    
+    idx_jit = _kernels.ring_write(flat, buf_jit, write_idx)
+    idx_np = _kernels._ring_write_numpy(flat, buf_np, write_idx)
+    
+    assert idx_jit == idx_np == (write_idx + n) % 10
+    np.testing.assert_array_equal(buf_jit, buf_np)
+    # The newest sample sits just before the write index
+    assert buf_np[idx_np - 1] == flat[-1]
+
+
+@pytest.mark.parametrize("channels", [1, 2])
+@pytest.mark.parametrize("with_level", [True, False])
+def test_apply_gain_backends_agree(channels, with_level):
+    block = _block(16, channels)
+    dst_jit = np.zeros_like(block)
+    dst_np = np.zeros_like(block)
+    
+    level_jit = _kernels.apply_gain(block, 1.5, dst_jit, with_level)
+    level_np = _kernels._apply_gain_numpy(block, 1.5, dst_np, with_level)
+    
+    np.testing.assert_allclose(dst_jit, dst_np, rtol=1e-6)
+    assert level_jit == pytest.approx(level_np, rel=1e-5)
+    if with_level:
+        assert level_np == pytest.approx(float(np.abs(block * 1.5).mean()), rel=1e-5)
+    else:
+        assert level_jit == level_np == 0.0
+
+
+@pytest.mark.parametrize("write_idx, frames", [(0, 4), (6, 4), (5, 12)])
+@pytest.mark.parametrize("channels", [1, 2])
+def test_ingest_backends_agree(write_idx, frames, channels):
+    block = _block(frames, channels)
+    dst_jit = np.zeros_like(block)
+    dst_np = np.zeros_like(block)
+    buf_jit = np.zeros(8, dtype=np.float32)
+    buf_np = buf_jit.copy()
+    
+    idx_jit, level_jit = _kernels.ingest(block, 0.5, dst_jit, buf_jit, write_idx, True)
+    idx_np, level_np = _kernels._ingest_numpy(block, 0.5, dst_np, buf_np, write_idx, True)
+    
+    assert idx_jit == idx_np
+    assert level_jit == pytest.approx(level_np, rel=1e-5)
+    np.testing.assert_allclose(dst_jit, dst_np, rtol=1e-6)
+    np.testing.assert_allclose(buf_jit, buf_np, rtol=1e-6)
+
+
+@pytest.mark.parametrize("simd", [True, False])
+def test_rms_peak_backends_agree(simd, monkeypatch):
+    if simd and _kernels._rms_simd is None:
+        pytest.skip("numpy-rms not installed")
+    if not simd:
+        monkeypatch.setattr(_kernels, "_rms_simd", None)
+    x = _block(1024).reshape(-1)
+    x[100] = -0.75  # negative peak
+    
+    rms_jit, peak_jit = _kernels.rms_peak(x)
+    rms_np, peak_np = _kernels._rms_peak_numpy(x)
+    
+    assert rms_jit == pytest.approx(rms_np, rel=1e-5)
+    assert rms_np == pytest.approx(float(np.sqrt(np.mean(x.astype(np.float64) ** 2))), rel=1e-5)
+    assert peak_jit == peak_np == pytest.approx(0.75)
+
+
+def test_meter_block_peak_hold_backends_agree(monkeypatch):
+    # A loud block, then quiet ones until the hold (10 samples) has run out
+    blocks = [np.full(4, level, dtype=np.float32) for level in (0.8, 0.1, 0.1, 0.1, 0.2, 0.05)]
+    
+    def run(meter_block):
+        state = np.zeros(2, dtype=np.float64)
+        history = []
+        for x in blocks:
+            rms = meter_block(x, x.shape[0], state, 10)
+            history.append((rms, state[0], state[1]))
+        return history
+    
+    compiled = run(_kernels.meter_block)
+    # The pure-Python body, with the NumPy RMS/peak it uses without Numba
+    monkeypatch.setattr(_kernels, "rms_peak", _kernels._rms_peak_numpy)
+    python = run(_kernels._meter_block_py)
+    
+    for (rms_c, peak_c, hold_c), (rms_p, peak_p, hold_p) in zip(compiled, python):
+        assert rms_c == pytest.approx(rms_p, rel=1e-5)
+        assert peak_c == pytest.approx(peak_p)
+        assert hold_c == hold_p
+    
+    # Peak held at 0.8 while the counter runs down (10 -> 6 -> 2 -> -2),
+    # then released to the current block's peak
+    assert [h[1] for h in python] == pytest.approx([0.8, 0.8, 0.8, 0.8, 0.2, 0.05])
+    assert [h[2] for h in python] == [10, 6, 2, -2, -2, -2]